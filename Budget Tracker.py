@@ -130,18 +130,149 @@ def validate_date(date_string):
         print("Invalid date format. Please use MM-DD-YYYY.")
         return False
 
+# ==================
+# Undo / Redo History
+# ==================
+
+# Create an empty undo/redo history
+def create_history():
+    """
+    Create an empty undo/redo history for transaction and goal changes.
+
+    Each entry is a small delta describing a single change (the affected row or
+    goal keys with their before/after values), never a copy of the whole ledger.
+
+    Returns:
+    - A dictionary with 'undo' and 'redo' stacks.
+    """
+    return {"undo": [], "redo": []}
+
+
+# Record a change in the history
+def record_change(history, change):
+    """
+    Push a change onto the undo stack and discard any redo entries.
+
+    Args:
+    - history: The history dictionary from create_history(), or None to skip recording.
+    - change: The delta describing the change.
+    """
+    if history is None:
+        return
+    history["undo"].append(change)
+    history["redo"].clear()
+
+
+# Apply a recorded change forwards or backwards
+def apply_change(data, budget_goals, change, reverse=False):
+    """
+    Apply a recorded change to the transactions or budget goals.
+
+    Transaction changes hold the row index plus the row before and after the change
+    (None for a row that did not exist). Goal changes hold a list of
+    (category, before, after) entries (None for a goal that did not exist).
+
+    Args:
+    - data: A DataFrame containing transaction data.
+    - budget_goals: A dictionary of budget goals by category.
+    - change: The delta to apply.
+    - reverse: True to undo the change, False to (re)apply it.
+
+    Returns:
+    - The updated DataFrame and budget goals dictionary.
+    """
+    if change["target"] == "transactions":
+        index = change["index"]
+        row_from, row_to = change["before"], change["after"]
+        if reverse:
+            row_from, row_to = row_to, row_from
+
+        if row_from is None:
+            # Re-insert the row at its original position
+            new_row = pd.DataFrame([row_to])
+            data = pd.concat([data.iloc[:index], new_row, data.iloc[index:]], ignore_index=True)
+        elif row_to is None:
+            # Remove the row
+            data = data.drop(index).reset_index(drop=True)
+        else:
+            # Restore the row's values in place
+            for column, value in row_to.items():
+                data.at[index, column] = value
+
+    elif change["target"] == "goals":
+        entries = change["entries"]
+        if reverse:
+            entries = reversed(entries)
+        for category, before, after in entries:
+            value = before if reverse else after
+            if value is None:
+                budget_goals.pop(category, None)
+            else:
+                budget_goals[category] = value
+
+    return data, budget_goals
+
+
+# Undo the most recent change
+def undo_change(data, budget_goals, history):
+    """
+    Undo the most recent transaction or goal change.
+
+    Args:
+    - data: A DataFrame containing transaction data.
+    - budget_goals: A dictionary of budget goals by category.
+    - history: The history dictionary from create_history().
+
+    Returns:
+    - The updated DataFrame and budget goals dictionary.
+    """
+    if not history["undo"]:
+        print("Nothing to undo.")
+        return data, budget_goals
+
+    change = history["undo"].pop()
+    data, budget_goals = apply_change(data, budget_goals, change, reverse=True)
+    history["redo"].append(change)
+    print(f"Undid: {change['description']}")
+    return data, budget_goals
+
+
+# Redo the most recently undone change
+def redo_change(data, budget_goals, history):
+    """
+    Redo the most recently undone transaction or goal change.
+
+    Args:
+    - data: A DataFrame containing transaction data.
+    - budget_goals: A dictionary of budget goals by category.
+    - history: The history dictionary from create_history().
+
+    Returns:
+    - The updated DataFrame and budget goals dictionary.
+    """
+    if not history["redo"]:
+        print("Nothing to redo.")
+        return data, budget_goals
+
+    change = history["redo"].pop()
+    data, budget_goals = apply_change(data, budget_goals, change)
+    history["undo"].append(change)
+    print(f"Redid: {change['description']}")
+    return data, budget_goals
+
 # =======================
 # Add / Edit Transactions
 # =======================
 
 # Add or edit transactions
-def add_edit_transactions(data, action):
+def add_edit_transactions(data, action, history=None):
     """
     Add or edit transactions in the budget tracker.
 
     Args:
     - data: A DataFrame containing transaction data.
     - action: 'add' for adding a new transaction, 'edit' for modifying an existing one.
+    - history: Optional history dictionary to record the change for undo/redo.
 
     Returns:
     - Updated DataFrame with the new or modified transaction.
@@ -175,6 +306,9 @@ def add_edit_transactions(data, action):
         else:
             data = pd.concat([data, pd.DataFrame([new_row])], ignore_index=True)
 
+        record_change(history, {"target": "transactions", "index": len(data) - 1,
+                                "before": None, "after": new_row,
+                                "description": f"add transaction {category} ${amount:.2f}"})
         print("Transaction added successfully!")
 
     elif action == 'edit':
@@ -200,7 +334,11 @@ def add_edit_transactions(data, action):
                     print("Invalid transaction number to delete.")
                     return data
                 else:
+                    deleted_row = data.loc[delete_num - 1].to_dict()
                     data = data.drop(delete_num - 1).reset_index(drop=True)
+                    record_change(history, {"target": "transactions", "index": delete_num - 1,
+                                            "before": deleted_row, "after": None,
+                                            "description": f"delete transaction {deleted_row['Category']}"})
                     print("Transaction deleted successfully.")
                     return data
             if transaction_num < 1 or transaction_num > len(data):
@@ -238,11 +376,16 @@ def add_edit_transactions(data, action):
             return data
 
         # Update the selected transaction
+        old_row = {column: selected_transaction[column] for column in ['Date', 'Type', 'Category', 'Amount']}
         data.at[transaction_num - 1, 'Date'] = date
         data.at[transaction_num - 1, 'Type'] = type_
         data.at[transaction_num - 1, 'Category'] = category
         data.at[transaction_num - 1, 'Amount'] = amount
 
+        new_row = {'Date': date, 'Type': type_, 'Category': category, 'Amount': amount}
+        record_change(history, {"target": "transactions", "index": transaction_num - 1,
+                                "before": old_row, "after": new_row,
+                                "description": f"edit transaction {category}"})
         print("Transaction updated successfully!")
 
     else:
@@ -255,13 +398,14 @@ def add_edit_transactions(data, action):
 # =======================
 
 # Add and edit budget goals
-def add_edit_goals(budget_goals, action):
+def add_edit_goals(budget_goals, action, history=None):
     """
     Adds or edits budget goals in a similar style to add_edit_transactions.
     
     Args:
     - budget_goals: A dictionary where keys are category names, and values are goal amounts.
     - action: 'add' for adding a new goal, 'edit' for modifying or deleting an existing goal.
+    - history: Optional history dictionary to record the change for undo/redo.
 
     Returns:
     - Updated dictionary of budget goals.
@@ -279,6 +423,9 @@ def add_edit_goals(budget_goals, action):
             return budget_goals
         
         # Add the new goal
+        record_change(history, {"target": "goals",
+                                "entries": [(category, budget_goals.get(category), goal_amount)],
+                                "description": f"set goal for {category}"})
         budget_goals[category] = goal_amount
         print(f"Budget goal for '{category}' set to ${goal_amount:.2f}!")
 
@@ -306,8 +453,11 @@ def add_edit_goals(budget_goals, action):
                     print("Invalid goal number to delete.")
                     return budget_goals
                 else:
-                    cat_to_delete = goals_list[delete_num - 1][0]
+                    cat_to_delete, amt_to_delete = goals_list[delete_num - 1]
                     budget_goals.pop(cat_to_delete)
+                    record_change(history, {"target": "goals",
+                                            "entries": [(cat_to_delete, amt_to_delete, None)],
+                                            "description": f"delete goal for {cat_to_delete}"})
                     print(f"Goal for '{cat_to_delete}' deleted successfully.")
                     return budget_goals
             if goal_num < 1 or goal_num > len(goals_list):
@@ -344,6 +494,13 @@ def add_edit_goals(budget_goals, action):
         # Update dictionary:
         # 1. Remove the old category key if the user renamed it.
         # 2. Insert the new category key or update the same key with the new amount.
+        entries = []
+        if new_category != selected_category:
+            entries.append((selected_category, selected_amount, None))
+        entries.append((new_category, budget_goals.get(new_category), new_goal_amount))
+        record_change(history, {"target": "goals", "entries": entries,
+                                "description": f"edit goal for {selected_category}"})
+
         if new_category != selected_category:
             # Remove old entry
             budget_goals.pop(selected_category)
@@ -526,8 +683,10 @@ def main_menu():
     print("9. Generate Report")
     print("10. Save Program Data")
     print("11. Export to CSV File")
-    print("12. Exit")
-    return input("Choose an option (1-12): ")
+    print("12. Undo Last Change")
+    print("13. Redo Last Change")
+    print("14. Exit")
+    return input("Choose an option (1-14): ")
 
 
 # Main Program
@@ -542,6 +701,7 @@ def budget_tracker():
     # Set default state (blank) upon startup
     budget_data = pd.DataFrame(columns=["Date", "Type", "Category", "Amount"])  # Blank DataFrame for transactions
     budget_goals = {}  # Empty dictionary for budget goals
+    history = create_history()  # Undo/redo history for transaction and goal changes
     
     while True:
         choice = main_menu()
@@ -550,6 +710,7 @@ def budget_tracker():
             try:
                 file_path = input("Enter the path to your CSV file: ")
                 budget_data = pd.read_csv(file_path)
+                history = create_history()  # Earlier changes no longer apply to the new data
                 print("Data successfully imported!")
 
                 # Validate and clean column names
@@ -592,13 +753,14 @@ def budget_tracker():
 
         elif choice == '2':  # Load Previous Session
             budget_data, budget_goals = load_data(json_filename=json_file_path, csv_filename=csv_file_path)  # Load the saved session
+            history = create_history()  # Earlier changes no longer apply to the loaded session
             print("Previous session loaded.")
 
         elif choice == '3':  # Add a Transaction
-            budget_data = add_edit_transactions(budget_data, 'add')
+            budget_data = add_edit_transactions(budget_data, 'add', history)
 
         elif choice == '4':  # Edit a Transaction
-            budget_data = add_edit_transactions(budget_data, 'edit')
+            budget_data = add_edit_transactions(budget_data, 'edit', history)
 
         elif choice == '5':  # View All Transactions
             print("\n--- Current Transactions ---")
@@ -626,9 +788,9 @@ def budget_tracker():
     
             sub_choice = input("Would you like to (A)dd or (E)dit existing goals? (a/e): ").strip().lower()
             if sub_choice == 'a':
-                budget_goals = add_edit_goals(budget_goals, 'add')
+                budget_goals = add_edit_goals(budget_goals, 'add', history)
             elif sub_choice == 'e':
-                budget_goals = add_edit_goals(budget_goals, 'edit')
+                budget_goals = add_edit_goals(budget_goals, 'edit', history)
             else:
                 print("Invalid choice. No changes made to goals.")
 
@@ -658,12 +820,18 @@ def budget_tracker():
                 csv_file_path = os.path.join(storage_directory, 'budget_data.csv')  # Define CSV file path
                 save_to_csv(budget_data, csv_file_path)  # Save to CSV
 
-        elif choice == '12':  # Exit
+        elif choice == '12':  # Undo Last Change
+            budget_data, budget_goals = undo_change(budget_data, budget_goals, history)
+
+        elif choice == '13':  # Redo Last Change
+            budget_data, budget_goals = redo_change(budget_data, budget_goals, history)
+
+        elif choice == '14':  # Exit
             print("Exiting the program. Goodbye!")
             break
 
         else:
-            print("Invalid choice. Please enter a number between 1 and 12.")
+            print("Invalid choice. Please enter a number between 1 and 14.")
 
 
 # Run program